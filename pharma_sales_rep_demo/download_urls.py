@@ -7,16 +7,48 @@ saving them in a specified directory.
 """
 
 import argparse
+import asyncio
+import atexit
+import base64
+import json
 import os
 import re
 import sys
 import time
+import queue
 import hashlib
 import logging
+import threading
+from collections import defaultdict
 from pathlib import Path
 from urllib.parse import urlparse
 import requests
-from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Optional async HTTP backend for the direct-download fast path
+try:
+    import aiohttp
+    _HAS_AIOHTTP = True
+except ImportError:
+    _HAS_AIOHTTP = False
+
+# Optional PDF conversion backends, imported once at module load
+try:
+    import pdfkit
+    _HAS_PDFKIT = True
+except ImportError:
+    _HAS_PDFKIT = False
+
+try:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+    from webdriver_manager.chrome import ChromeDriverManager
+    _HAS_SELENIUM = True
+except ImportError:
+    _HAS_SELENIUM = False
 
 # Set up logging
 logging.basicConfig(
@@ -29,11 +61,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Compiled once; generate_filename runs these per URL
+_EXT_RE = re.compile(r'\.\w+$')
+_UNSAFE_RE = re.compile(r'[^a-zA-Z0-9._-]')
+
+# HTTP statuses worth retrying; shared by the requests and aiohttp paths
+_RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+
+
+def _iter_urls(url_file):
+    """Yield URLs from a file one line at a time, skipping blanks/comments"""
+    with open(url_file, 'r') as f:
+        for line in f:
+            url = line.strip()
+            if url and not url.startswith('#'):
+                yield url
+
 class PDFDownloader:
     """Class to handle downloading URLs as PDFs"""
     
-    def __init__(self, output_dir="./pdf_downloads", max_retries=3, delay=2, 
-                 concurrent_downloads=5, timeout=30):
+    def __init__(self, output_dir="./pdf_downloads", max_retries=3, delay=2,
+                 concurrent_downloads=5, timeout=30, force=False,
+                 revalidate=False, chromedriver_path=None):
         """Initialize the downloader with configuration options"""
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
@@ -41,24 +90,70 @@ class PDFDownloader:
         self.delay = delay
         self.concurrent_downloads = concurrent_downloads
         self.timeout = timeout
+        self.force = force
+        self.revalidate = revalidate
         self.user_agent = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
-        
-        # Check for PDF conversion capabilities
+
+        # Shared session with connection pooling so downloads to the same host
+        # reuse TCP/TLS connections instead of reconnecting per URL
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=concurrent_downloads,
+            pool_maxsize=concurrent_downloads * 2,
+            max_retries=Retry(
+                total=max_retries,
+                backoff_factor=delay,
+                status_forcelist=_RETRY_STATUS_CODES
+            )
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"User-Agent": self.user_agent})
+
+        # Pool of long-lived headless Chrome drivers, created lazily and
+        # reused across URLs instead of paying the startup cost per page
+        self._driver_pool = queue.Queue()
+        self._driver_lock = threading.Lock()
+        # A pinned driver path (arg or CHROMEDRIVER_PATH env var) skips the
+        # ChromeDriverManager version check, which hits the network;
+        # otherwise the path is resolved once on first driver creation
+        self._chromedriver_path = chromedriver_path or os.environ.get("CHROMEDRIVER_PATH")
+
+        # Per-host pacing state so concurrent workers stay polite to each
+        # host without serializing work across different hosts
+        self._host_locks = defaultdict(threading.Lock)
+        self._host_last_request = {}
+
+        # Cached ETag/Last-Modified validators per URL so recrawls can use
+        # conditional GETs and skip unchanged bodies entirely
+        self._meta_path = self.output_dir / ".etag_cache.json"
+        self._meta_lock = threading.Lock()
         try:
-            import pdfkit
-            self.pdfkit_available = True
+            with open(self._meta_path, 'r') as f:
+                self._meta = json.load(f)
+        except (OSError, ValueError):
+            self._meta = {}
+        atexit.register(self._save_meta)
+
+        # Check for PDF conversion capabilities
+        self.pdfkit_available = _HAS_PDFKIT
+        if self.pdfkit_available:
             logger.info("pdfkit is available for HTML to PDF conversion")
-        except ImportError:
-            self.pdfkit_available = False
+        else:
             logger.warning("pdfkit not available. Install with: pip install pdfkit")
             logger.warning("Also install wkhtmltopdf: https://wkhtmltopdf.org/downloads.html")
-        
-        try:
-            from selenium import webdriver
-            self.selenium_available = True
+
+        self.aiohttp_available = _HAS_AIOHTTP
+        if self.aiohttp_available:
+            logger.info("aiohttp is available; PDF downloads will run on the event loop")
+        else:
+            logger.warning("aiohttp not available; falling back to thread-based downloads")
+            logger.warning("For higher download concurrency: pip install aiohttp")
+
+        self.selenium_available = _HAS_SELENIUM
+        if self.selenium_available:
             logger.info("Selenium is available for advanced HTML to PDF conversion")
-        except ImportError:
-            self.selenium_available = False
+        else:
             logger.warning("Selenium not available. For better results with JavaScript-heavy sites:")
             logger.warning("pip install selenium webdriver-manager")
 
@@ -79,47 +174,92 @@ class PDFDownloader:
                 filename = parts[-1] or parts[-2] if len(parts) > 1 else parsed.netloc
                 
                 # Clean up the name
-                filename = re.sub(r'\.\w+$', '', filename)  # Remove extension
+                filename = _EXT_RE.sub('', filename)  # Remove extension
                 filename += '.pdf'  # Add PDF extension
             else:
                 # Create a hash-based name if path is empty
                 domain = parsed.netloc.replace('www.', '')
-                url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+                url_hash = hashlib.blake2b(url.encode(), digest_size=4).hexdigest()
                 filename = f"{domain}_{url_hash}.pdf"
         
         # Clean up the filename
-        filename = re.sub(r'[^a-zA-Z0-9._-]', '_', filename)
+        filename = _UNSAFE_RE.sub('_', filename)
         return filename
 
-    def download_pdf(self, url):
-        """Download a direct PDF URL"""
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                headers = {"User-Agent": self.user_agent}
-                response = requests.get(url, headers=headers, timeout=self.timeout, stream=True)
+    def _conditional_headers(self, url, output_path):
+        """Validators for a conditional GET when the file is already on disk"""
+        # --force promises a fresh download, so never let a 304 keep a
+        # possibly-bad local copy; an empty file is never worth keeping either
+        if self.force or not output_path.exists() or output_path.stat().st_size == 0:
+            return {}
+        meta = self._meta.get(url, {})
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def _store_validators(self, url, response_headers):
+        """Remember a response's ETag/Last-Modified for the next recrawl"""
+        etag = response_headers.get('ETag')
+        last_modified = response_headers.get('Last-Modified')
+        if etag or last_modified:
+            with self._meta_lock:
+                self._meta[url] = {'etag': etag, 'last_modified': last_modified}
+
+    def _save_meta(self):
+        """Persist the validator cache next to the downloaded files"""
+        if not self._meta:
+            return
+        try:
+            with self._meta_lock, open(self._meta_path, 'w') as f:
+                json.dump(self._meta, f)
+        except OSError as e:
+            logger.warning(f"Failed to save validator cache: {e}")
+
+    def download_pdf(self, url, output_path):
+        """Download a direct PDF URL, streaming it to output_path.
+
+        Returns the number of bytes written, or None on failure.
+        """
+        tmp_path = output_path.with_suffix('.part')
+        try:
+            headers = self._conditional_headers(url, output_path)
+            with self.session.get(url, headers=headers, timeout=self.timeout,
+                                  stream=True) as response:
+                if response.status_code == 304:
+                    logger.info(f"Not modified, keeping cached copy: {url}")
+                    return output_path.stat().st_size
                 response.raise_for_status()
-                
-                if response.headers.get('content-type', '').lower() == 'application/pdf':
-                    return response.content
-                else:
+
+                if 'application/pdf' not in response.headers.get('content-type', '').lower():
                     logger.warning(f"URL does not return PDF content: {url}")
                     return None
-                    
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Attempt {attempt} failed: {e}")
-                if attempt < self.max_retries:
-                    time.sleep(self.delay)
-                else:
-                    logger.error(f"Failed to download after {self.max_retries} attempts: {url}")
-                    return None
-        return None
+
+                # Stream to a temp file so a failed download never leaves a
+                # truncated PDF behind, and the full body never sits in RAM.
+                # A 1 MiB write buffer coalesces the 64 KiB chunks into far
+                # fewer write(2) syscalls
+                written = 0
+                with open(tmp_path, 'wb', buffering=1 << 20) as f:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        f.write(chunk)
+                        written += len(chunk)
+                self._store_validators(url, response.headers)
+            os.replace(tmp_path, output_path)
+            return written
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to download after {self.max_retries} attempts: {url} ({e})")
+            tmp_path.unlink(missing_ok=True)
+            return None
 
     def html_to_pdf_pdfkit(self, url):
         """Convert HTML to PDF using pdfkit"""
         if not self.pdfkit_available:
             return None
-        
-        import pdfkit
+
         try:
             options = {
                 'javascript-delay': 2000,
@@ -133,34 +273,63 @@ class PDFDownloader:
             logger.error(f"pdfkit conversion failed: {e}")
             return None
 
+    def _get_driver(self):
+        """Get a headless Chrome driver from the pool, creating one if needed"""
+        try:
+            return self._driver_pool.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._driver_lock:
+            # Resolve the chromedriver path once and reuse it for every driver
+            if self._chromedriver_path is None:
+                self._chromedriver_path = ChromeDriverManager().install()
+
+        chrome_options = Options()
+        chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument(f"user-agent={self.user_agent}")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+
+        return webdriver.Chrome(
+            service=Service(self._chromedriver_path),
+            options=chrome_options
+        )
+
+    def close(self):
+        """Shut down any pooled Chrome drivers"""
+        while True:
+            try:
+                driver = self._driver_pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    def __del__(self):
+        self.close()
+
     def html_to_pdf_selenium(self, url):
         """Convert HTML to PDF using Selenium with Chrome"""
         if not self.selenium_available:
             return None
-        
-        from selenium import webdriver
-        from selenium.webdriver.chrome.service import Service
-        from webdriver_manager.chrome import ChromeDriverManager
-        from selenium.webdriver.chrome.options import Options
-        import base64
-        
+
+        try:
+            driver = self._get_driver()
+        except Exception as e:
+            logger.error(f"Failed to start Chrome driver: {e}")
+            return None
+
         try:
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument(f"user-agent={self.user_agent}")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            
-            driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()),
-                options=chrome_options
-            )
-            
             driver.get(url)
-            # Wait for JavaScript to execute
+            # driver.get already blocks until the document is loaded; give
+            # scripts that render after load (SPAs, XHR content) time to
+            # settle before printing
             time.sleep(3)
-            
+
             # Execute Chrome's Print to PDF
             print_options = {
                 'landscape': False,
@@ -169,50 +338,215 @@ class PDFDownloader:
                 'preferCSSPageSize': True,
             }
             result = driver.execute_cdp_cmd("Page.printToPDF", print_options)
-            driver.quit()
-            
+
             # Convert base64 to PDF content
-            return base64.b64decode(result['data'])
+            content = base64.b64decode(result['data'])
         except Exception as e:
             logger.error(f"Selenium conversion failed: {e}")
+            # The driver may be dead (Chrome crash, lost session); discard
+            # it rather than recycling it and let _get_driver start fresh
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            return None
+
+        # Return the healthy driver to the pool for the next URL
+        self._driver_pool.put(driver)
+        return content
+
+    def _write_content(self, content, output_path):
+        """Write already-converted PDF bytes atomically via a temp file.
+
+        Returns the number of bytes written, or None on failure.
+        """
+        tmp_path = output_path.with_suffix('.part')
+        try:
+            with open(tmp_path, 'wb', buffering=1 << 20) as f:
+                # memoryview avoids copying the (potentially large) bytes
+                f.write(memoryview(content))
+            os.replace(tmp_path, output_path)
+            return len(content)
+        except OSError as e:
+            logger.error(f"Failed to write {output_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
             return None
 
+    def _respect_host_delay(self, url):
+        """Wait as long as needed to keep self.delay between requests to a host"""
+        host = urlparse(url).netloc
+        while True:
+            # Never sleep while holding the lock: coroutines in
+            # _respect_host_delay_async take it from the event-loop thread,
+            # and a sleeping holder would stall the whole loop
+            with self._host_locks[host]:
+                last = self._host_last_request.get(host, 0.0)
+                wait = self.delay - (time.time() - last)
+                if wait <= 0:
+                    self._host_last_request[host] = time.time()
+                    return
+            time.sleep(wait)
+
+    async def _respect_host_delay_async(self, url):
+        """Event-loop-friendly variant of _respect_host_delay"""
+        host = urlparse(url).netloc
+        while True:
+            with self._host_locks[host]:
+                last = self._host_last_request.get(host, 0.0)
+                wait = self.delay - (time.time() - last)
+                if wait <= 0:
+                    self._host_last_request[host] = time.time()
+                    return
+            await asyncio.sleep(wait)
+
     def process_url(self, url):
         """Process a single URL to download or convert to PDF"""
         url = url.strip()
         if not url or url.startswith('#'):
             return None
-            
+
         filename = self.generate_filename(url)
         output_path = self.output_dir / filename
-        
+
+        # Skip files already downloaded so reruns only fetch what's missing;
+        # --revalidate recrawls them with conditional GETs instead
+        if (not self.force and not self.revalidate
+                and output_path.exists() and output_path.stat().st_size > 0):
+            logger.info(f"Skipping existing file: {filename}")
+            return True
+
         logger.info(f"Processing: {url}")
         logger.info(f"Output file: {output_path}")
-        
-        # Determine if it's a direct PDF or needs conversion
-        if url.lower().endswith('.pdf'):
-            content = self.download_pdf(url)
+
+        # Pace requests per host rather than per submission
+        self._respect_host_delay(url)
+
+        # Determine if it's a direct PDF or needs conversion. A cheap HEAD
+        # catches PDFs served from extension-less URLs (common on CDNs) so
+        # they skip the heavy Selenium path entirely
+        content_type = ''
+        if not url.lower().endswith('.pdf'):
+            try:
+                head = self.session.head(url, allow_redirects=True, timeout=self.timeout)
+                content_type = head.headers.get('content-type', '').lower()
+            except requests.exceptions.RequestException:
+                # Some servers reject HEAD; fall back to the extension check
+                pass
+
+        if url.lower().endswith('.pdf') or 'application/pdf' in content_type:
+            size = self.download_pdf(url, output_path)
         else:
             # Try HTML to PDF conversion methods
             content = None
             if self.selenium_available:
                 logger.info("Attempting conversion with Selenium...")
                 content = self.html_to_pdf_selenium(url)
-            
+
             if content is None and self.pdfkit_available:
                 logger.info("Attempting conversion with pdfkit...")
                 content = self.html_to_pdf_pdfkit(url)
-            
-            if content is None:
+
+            if content is not None:
+                size = self._write_content(content, output_path)
+            else:
                 logger.info("Attempting direct download...")
-                content = self.download_pdf(url)
-                
-        if content:
-            with open(output_path, 'wb') as f:
-                f.write(content)
-            
-            # Verify file size
-            size = os.path.getsize(output_path)
+                size = self.download_pdf(url, output_path)
+
+        if size is not None:
+            # Verify file size (tracked during the write, no extra stat)
+            if size > 0:
+                logger.info(f"✅ Successfully saved: {filename} ({size/1024:.1f} KB)")
+                return True
+            else:
+                logger.warning(f"⚠️ File is empty: {filename}")
+                return False
+        else:
+            logger.error(f"❌ Failed to process URL: {url}")
+            return False
+
+    async def _download_pdf_async(self, http, url, output_path):
+        """aiohttp counterpart of download_pdf.
+
+        Returns the number of bytes written, or None on failure.
+        """
+        tmp_path = output_path.with_suffix('.part')
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                headers = self._conditional_headers(url, output_path)
+                # Bound connect time and per-read stalls like the requests
+                # path does; a total cap would kill large, slow transfers
+                timeout = aiohttp.ClientTimeout(
+                    sock_connect=self.timeout, sock_read=self.timeout)
+                async with http.get(url, headers=headers, timeout=timeout) as response:
+                    if response.status == 304:
+                        logger.info(f"Not modified, keeping cached copy: {url}")
+                        return output_path.stat().st_size
+                    response.raise_for_status()
+
+                    if 'application/pdf' not in response.headers.get('Content-Type', '').lower():
+                        logger.warning(f"URL does not return PDF content: {url}")
+                        return None
+
+                    written = 0
+                    with open(tmp_path, 'wb', buffering=1 << 20) as f:
+                        async for chunk in response.content.iter_chunked(65536):
+                            f.write(chunk)
+                            written += len(chunk)
+                    self._store_validators(url, response.headers)
+                os.replace(tmp_path, output_path)
+                return written
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                tmp_path.unlink(missing_ok=True)
+                # Match the sync path's urllib3 Retry: only transient
+                # statuses are worth another attempt, not e.g. 404/403
+                if (isinstance(e, aiohttp.ClientResponseError)
+                        and e.status not in _RETRY_STATUS_CODES):
+                    logger.error(f"Failed to download: {url} (HTTP {e.status})")
+                    return None
+                logger.warning(f"Attempt {attempt} failed: {e}")
+                if attempt < self.max_retries:
+                    await asyncio.sleep(self.delay)
+                else:
+                    logger.error(f"Failed to download after {self.max_retries} attempts: {url}")
+        return None
+
+    async def _process_url_async(self, http, semaphore, url):
+        """Async counterpart of process_url.
+
+        Direct PDF URLs are streamed on the event loop; HTML conversion
+        URLs go through the blocking Selenium/pdfkit chain in a worker
+        thread.
+        """
+        url = url.strip()
+        if not url or url.startswith('#'):
+            return None
+
+        filename = self.generate_filename(url)
+        output_path = self.output_dir / filename
+
+        # Skip files already downloaded so reruns only fetch what's missing;
+        # --revalidate recrawls them with conditional GETs instead
+        if (not self.force and not self.revalidate
+                and output_path.exists() and output_path.stat().st_size > 0):
+            logger.info(f"Skipping existing file: {filename}")
+            return True
+
+        if not url.lower().endswith('.pdf'):
+            # Conversion (and content-type sniffing) is blocking code; hold
+            # the semaphore so Chrome instances stay bounded by
+            # concurrent_downloads rather than the default executor size
+            async with semaphore:
+                return await asyncio.to_thread(self.process_url, url)
+
+        logger.info(f"Processing: {url}")
+        logger.info(f"Output file: {output_path}")
+
+        async with semaphore:
+            await self._respect_host_delay_async(url)
+            size = await self._download_pdf_async(http, url, output_path)
+
+        if size is not None:
             if size > 0:
                 logger.info(f"✅ Successfully saved: {filename} ({size/1024:.1f} KB)")
                 return True
@@ -223,6 +557,39 @@ class PDFDownloader:
             logger.error(f"❌ Failed to process URL: {url}")
             return False
 
+    async def _download_all_async(self, urls):
+        """Drive all URLs through the event loop with bounded concurrency"""
+        semaphore = asyncio.Semaphore(self.concurrent_downloads)
+        connector = aiohttp.TCPConnector(
+            limit=self.concurrent_downloads * 2,
+            limit_per_host=4,
+            keepalive_timeout=30
+        )
+        async with aiohttp.ClientSession(
+            connector=connector,
+            headers={"User-Agent": self.user_agent}
+        ) as http:
+            return await asyncio.gather(
+                *(self._process_url_async(http, semaphore, url) for url in urls)
+            )
+
+    def _download_all_threaded(self, urls):
+        """Thread-pool fallback used when aiohttp is not installed"""
+        results = []
+        with ThreadPoolExecutor(max_workers=self.concurrent_downloads) as executor:
+            futures = {executor.submit(self.process_url, url): url for url in urls}
+            try:
+                # Log results as they land instead of in submission order,
+                # so one hung download doesn't hide overall progress
+                for done, future in enumerate(as_completed(futures), start=1):
+                    results.append(future.result())
+                    logger.info(f"Progress: {done}/{len(futures)} URLs processed")
+            except BaseException:
+                # Fail fast: stop handing queued URLs to workers
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+        return results
+
     def download_all(self, url_file):
         """Download all URLs from a file"""
         # Check if URL file exists
@@ -230,25 +597,24 @@ class PDFDownloader:
             logger.error(f"URL file not found: {url_file}")
             return False
             
-        # Read URLs from file
-        with open(url_file, 'r') as f:
-            urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-            
-        logger.info(f"Found {len(urls)} URLs to process")
-        
-        # Process URLs concurrently
-        results = []
-        with ThreadPoolExecutor(max_workers=self.concurrent_downloads) as executor:
-            for i, url in enumerate(urls):
-                # Add a small delay between submissions to avoid hammering the server
-                if i > 0:
-                    time.sleep(0.5)
-                results.append(executor.submit(self.process_url, url))
-        
+        # Stream URLs from the file rather than materializing the list, so
+        # memory stays flat however large the input is
+        urls = _iter_urls(url_file)
+
+        # Process URLs concurrently; per-host pacing happens per URL
+        try:
+            if self.aiohttp_available:
+                results = asyncio.run(self._download_all_async(urls))
+            else:
+                results = self._download_all_threaded(urls)
+        finally:
+            self.session.close()
+            self.close()
+
         # Count successes and failures
-        successes = sum(1 for future in results if future.result())
-        failures = len(urls) - successes
-        
+        successes = sum(1 for result in results if result)
+        failures = len(results) - successes
+
         logger.info(f"Download process complete: {successes} successful, {failures} failed")
         logger.info(f"Files saved to: {self.output_dir}")
         
@@ -264,11 +630,20 @@ def main():
     parser.add_argument("-r", "--retries", type=int, default=3,
                         help="Maximum number of retry attempts")
     parser.add_argument("-d", "--delay", type=int, default=2,
-                        help="Delay between retry attempts (seconds)")
+                        help="Seconds between requests to the same host; "
+                             "also used as the retry backoff factor")
     parser.add_argument("-c", "--concurrent", type=int, default=3,
                         help="Number of concurrent downloads")
     parser.add_argument("-t", "--timeout", type=int, default=30,
                         help="Download timeout in seconds")
+    parser.add_argument("--chromedriver-path", default=None,
+                        help="Path to a pre-installed chromedriver binary "
+                             "(defaults to the CHROMEDRIVER_PATH env var)")
+    parser.add_argument("-f", "--force", action="store_true",
+                        help="Re-download files that already exist")
+    parser.add_argument("--revalidate", action="store_true",
+                        help="Recheck existing files with conditional GETs and "
+                             "re-download only those the server reports changed")
     parser.add_argument("-v", "--verbose", action="store_true",
                         help="Enable verbose logging")
                         
@@ -284,7 +659,10 @@ def main():
         max_retries=args.retries,
         delay=args.delay,
         concurrent_downloads=args.concurrent,
-        timeout=args.timeout
+        timeout=args.timeout,
+        force=args.force,
+        revalidate=args.revalidate,
+        chromedriver_path=args.chromedriver_path
     )
     
     try: